@@ -3,21 +3,46 @@ from io import BytesIO
 from graphviz import Source
 from PIL import Image
 
+# Every PNG ends with this IEND chunk (type + CRC), so concatenated PNGs split after it
+_PNG_END = b"IEND\xaeB`\x82"
 
-def draw_dot_content(dot_content: str) -> Image:
-    dot = """
+
+def _dot_source(dot_content: str) -> str:
+    return """
 digraph G {
   graph [compound=true, rankdir=LR, fontsize=16, nodesep=0.6];
   node  [shape=circle, fontsize=16];
   edge  [fontsize=12, arrowhead=none]; // default: no arrowheads
 """ + dot_content + "\n}"
-    src = Source(dot)
+
+
+def draw_dot_content(dot_content: str) -> Image:
+    src = Source(_dot_source(dot_content))
 
     png_bytes = src.pipe(format="png")
 
     return Image.open(BytesIO(png_bytes))
 
 
+def draw_dot_contents(dot_contents: list[str]) -> list[Image.Image]:
+    """Render many graphs with a single `dot` run instead of one process per graph.
+
+    `dot` renders every graph of its input in turn, writing the PNGs back to
+    back, so the output is split on the PNG end marker. Falls back to one run
+    per graph if the output doesn't split into one image per graph.
+    """
+    if not dot_contents:
+        return []
+    src = Source("\n".join(_dot_source(dot_content) for dot_content in dot_contents))
+
+    png_bytes = src.pipe(format="png")
+
+    images = [chunk + _PNG_END for chunk in png_bytes.split(_PNG_END)[:-1]]
+    if len(images) != len(dot_contents):
+        return [draw_dot_content(dot_content) for dot_content in dot_contents]
+    return [Image.open(BytesIO(image)) for image in images]
+
+
 def create_gif(frames: list[Image.Image], save=None) -> Image.Image:
     target = save if save is not None else BytesIO()
     frames[0].save(
@@ -23,11 +23,11 @@ def str_to_bytes(s: str) -> bytes:
     )
 
 
+_DOT_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+
 def dot_escape(s: str) -> str:
-    return s \
-        .replace("\\", "\\\\") \
-        .replace('"', '\\"') \
-        .replace("\n", "\\n")
+    return s.translate(_DOT_ESCAPE_TABLE)
 
 
 def merge_shared(merge_fn):
@@ -88,6 +88,9 @@ class Node(bytes, GraphVertex):
     # operations — which is what the trainer's Counter and merge scans hammer.
     # bytes wins the MRO for those, but we still want GraphVertex's __str__.
     __str__ = GraphVertex.__str__
+    # Like GraphVertex's, empty slots keep a per-node __dict__ off every Node
+    # (bytes subclasses may only declare empty slots).
+    __slots__ = ()
 
     def __new__(cls, value: bytes):
         return super().__new__(cls, value)
@@ -117,10 +120,7 @@ class NodesSequence(GraphVertex):
     _merges: tuple | None = field(default=None, init=False, compare=False, repr=False)
 
     def __bytes__(self):
-        buffer = bytearray()
-        for node in self.nodes:
-            buffer += bytes(node)
-        return bytes(buffer)
+        return b"".join(bytes(node) for node in self.nodes)
 
     @property
     def oid(self) -> str:  # object pointer id for Graphviz node id
@@ -128,26 +128,30 @@ class NodesSequence(GraphVertex):
 
     def get_merges(self):
         if not GraphSettings.TRADE_MEMORY_FOR_SPEED:
-            return self._iter_merges()
+            return self._collect_merges()
         # Memoize: get_merges is a pure function of an immutable node, and merge
         # returns self for unchanged subtrees, so the same objects recur across
         # merges and a full re-walk becomes a cache hit. Valid while GraphSettings
         # is fixed, which holds for a node's lifetime during training.
         cached = self._merges
         if cached is None:
-            cached = tuple(self._iter_merges())
+            cached = tuple(self._collect_merges())
             object.__setattr__(self, "_merges", cached)
         return cached
 
-    def _iter_merges(self):
+    def _collect_merges(self) -> list[tuple]:
         nodes = self.nodes
         num_nodes = len(nodes)
         only_minimal = GraphSettings.ONLY_MINIMAL_MERGES
         max_size = GraphSettings.MAX_MERGE_SIZE
 
+        # Built as one list (children's merges spliced in with extend) rather
+        # than a generator, so no frame is resumed per merge and nested
+        # sequences don't stack `yield from` delegation.
+        merges = []
         for i in range(num_nodes):
             node = nodes[i]
-            yield from node.get_merges()
+            merges.extend(node.get_merges())
 
             if only_minimal and not isinstance(node, Node):
                 continue
@@ -155,7 +159,8 @@ class NodesSequence(GraphVertex):
             for j in range(i + 2, min(i + max_size + 1, num_nodes + 1)):
                 if only_minimal and not isinstance(nodes[j - 1], Node):
                     break
-                yield (nodes[i], nodes[j - 1]) if j - i == 2 else tuple(nodes[i:j])
+                merges.append((node, nodes[j - 1]) if j - i == 2 else nodes[i:j])
+        return merges
 
     def node_count(self) -> int:
         return sum(n.node_count() for n in self.nodes)
@@ -182,13 +187,14 @@ class NodesSequence(GraphVertex):
                 out.append(token)
                 i += m
             else:
-                out.append(nodes[i])
+                # Copied nodes are merged recursively on the way, in the same single pass
+                out.append(nodes[i].merge(token, merge, memo))
                 i += 1
-        out.extend(nodes[i:])
+        out.extend(node.merge(token, merge, memo) for node in nodes[i:])
 
         if len(out) == 1:
             return out[0]
-        merged_nodes = tuple(node.merge(token, merge, memo) for node in out)
+        merged_nodes = tuple(out)
         if merged_nodes == nodes:
             return self
         return NodesSequence(merged_nodes)
@@ -224,6 +230,8 @@ class NodesSequence(GraphVertex):
 class Tree(GraphVertex):
     root: GraphVertex
     children: tuple[GraphVertex, ...]
+    # memo slot for get_merges (as in NodesSequence); excluded from eq/hash/repr
+    _merges: tuple | None = field(default=None, init=False, compare=False, repr=False)
 
     def dot(self, level=0) -> Iterable[str]:
         color = "#cce5ff" if level % 2 == 1 else "lightblue"
@@ -246,20 +254,39 @@ class Tree(GraphVertex):
     def oid(self, level=0) -> str:
         return self.root.oid
 
-    def get_merges(self) -> Iterator[tuple]:
-        yield from self.root.get_merges()
+    def get_merges(self):
+        if not GraphSettings.TRADE_MEMORY_FOR_SPEED:
+            return self._collect_merges()
+        # Memoized like NodesSequence.get_merges: a character's tree is one
+        # shared object across the corpus and stays unchanged until a merge
+        # reaches it.
+        cached = self._merges
+        if cached is None:
+            cached = tuple(self._collect_merges())
+            object.__setattr__(self, "_merges", cached)
+        return cached
+
+    def _collect_merges(self) -> list[tuple]:
+        merges = list(self.root.get_merges())
         if not GraphSettings.ONLY_MINIMAL_MERGES or (
             isinstance(self.root, Node) and all(isinstance(c, Node) for c in self.children)
         ):
-            yield (self.root,) + self.children
+            merges.append((self.root,) + self.children)
         for child in self.children:
-            yield from child.get_merges()
+            merges.extend(child.get_merges())
+        return merges
 
     def node_count(self) -> int:
         return self.root.node_count() + sum(c.node_count() for c in self.children)
 
     @merge_shared
     def merge(self, token: Node, nodes: tuple, memo: dict):
+        # As in NodesSequence.merge: a merge missing from the memoized
+        # candidates can't change anything in this subtree.
+        cached = self._merges
+        if cached is not None and nodes not in cached:
+            return self
+
         if nodes[0] == self.root:
             if len(nodes) == len(self.children) + 1:
                 if all(nodes[i + 1] == child for i, child in enumerate(self.children)):
@@ -272,10 +299,7 @@ class Tree(GraphVertex):
         return Tree(root=root, children=children)
 
     def __bytes__(self):
-        self_bytes = bytes(self.root)
-        for child in self.children:
-            self_bytes += bytes(child)
-        return self_bytes
+        return bytes(self.root) + b"".join(bytes(child) for child in self.children)
 
 
 @dataclass(frozen=True, slots=True)
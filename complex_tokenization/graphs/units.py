@@ -18,12 +18,17 @@ def register_script(script: str, handler: Callable[[str], GraphVertex]):
     _cluster_handlers[script] = handler
 
 
+@cache
+def _script_pattern(script: str) -> regex.Pattern:
+    return regex.compile(rf'\p{{{script}}}')
+
+
 def _get_handler(cluster: str) -> Callable[[str], GraphVertex] | None:
     if not _cluster_handlers:
         return None
     first_char = cluster[0]
     for script, handler in _cluster_handlers.items():
-        if regex.match(rf'\p{{{script}}}', first_char):
+        if _script_pattern(script).match(first_char):
             return handler
     return None
 
@@ -58,8 +63,13 @@ def utf8(s: str) -> GraphVertex:
     return NodesSequence(nodes=tuple(nodes))
 
 
+# Compiled once: a pattern string would go through regex's compile cache
+# lookup on every call, i.e. once per word and once per cluster per script.
+_CLUSTER_PATTERN = regex.compile(r'\X')
+
+
 def utf8_clusters(s: str) -> GraphVertex:
-    clusters = regex.findall(r'\X', s)
+    clusters = _CLUSTER_PATTERN.findall(s)
     nodes = []
     for cluster in clusters:
         handler = _get_handler(cluster)
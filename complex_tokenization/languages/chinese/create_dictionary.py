@@ -80,38 +80,75 @@ def canonicalize_dictionary(dictionary, canonicalization_rules):
     print("Canonicalizing dictionary values...")
     canonicalized = {}
 
+    # Rules apply per character, so only single-character sources can ever
+    # match; str.translate then rewrites each value in one C-level pass.
+    table = str.maketrans({source: target for source, target in canonicalization_rules.items()
+                           if len(source) == 1})
+
     for key, value in dictionary.items():
         # Apply canonicalization rules to each character in the value
-        canonical_value = ""
-        for char in value:
-            canonical_value += canonicalization_rules.get(char, char)
+        canonical_value = value.translate(table)
         if key != canonical_value:
             canonicalized[key] = canonical_value
 
     return canonicalized
 
 
-def expand_ids(value, dictionary):
-    expanded_value = ""
+def _expand(value, dictionary, memo, visiting):
+    """Expand value, returning (expansion, whether no cycle was cut short)."""
+    parts = []
+    complete = True
     for char in value:
-        if char in dictionary:
-            dictionary[char] = expand_ids(dictionary[char], dictionary)
-            expanded_value += dictionary[char]
-        else:
-            expanded_value += char
-    return expanded_value
+        expansion = memo.get(char)
+        if expansion is None:
+            if char not in dictionary:
+                expansion = char
+            elif char in visiting:
+                expansion = char
+                complete = False
+            else:
+                visiting.add(char)
+                expansion, char_complete = _expand(dictionary[char], dictionary, memo, visiting)
+                visiting.discard(char)
+                # A cut-short expansion depends on where the cycle was entered
+                if char_complete:
+                    memo[char] = expansion
+                complete = complete and char_complete
+        parts.append(expansion)
+    return "".join(parts), complete
+
+
+def expand_ids(value, dictionary, memo=None, visiting=None):
+    """Replace each character of value that has its own IDS with its full expansion.
+
+    Expansions are memoized per character (shared through `memo` across
+    calls), and a character that recurs inside its own expansion is left as
+    is rather than recursing forever on a cyclic entry.
+    """
+    if memo is None:
+        memo = {}
+    if visiting is None:
+        visiting = set()
+    return _expand(value, dictionary, memo, visiting)[0]
 
 
 def expand_dictionary(dictionary):
-    """Expand dictionary values by replacing characters that exist as keys."""
+    """Expand dictionary values by replacing characters that exist as keys.
+
+    Entries whose expansion still contains an unencoded component ({...}),
+    directly or through one of their components, are left out.
+    """
     print("Expanding dictionary values...")
     expanded = {}
+    memo = {}
 
     for key, value in dictionary.items():
-        if "{" in value:
+        # The key itself counts as visited, so a cycle stops where it returns
+        expansion = expand_ids(value, dictionary, memo, {key})
+        if "{" in expansion:
             continue
 
-        expanded[key] = expand_ids(value, dictionary)
+        expanded[key] = expansion
 
     return expanded
 
@@ -9,51 +9,72 @@ This script:
 5. Counts frequency of near-leaf patterns weighted by character frequency
 """
 
+import heapq
+import os
+from bisect import bisect_right
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import islice
 
-from datasets import load_dataset
+import numpy as np
+from datasets import Dataset, load_dataset
 from tqdm import tqdm
 
 from complex_tokenization.languages.chinese.ideographic_description_sequences import (
     IDSNode,
     get_character_for_ids,
     get_ids_for_character,
+    load_characters_dictionary,
     parse_ideographic_description_sequences,
 )
 
+# Half-open [start, end) codepoint ranges of the CJK Unified Ideographs blocks,
+# flattened into sorted boundaries: a code is inside a range exactly when an odd
+# number of boundaries are <= it. Adjacent blocks (Extensions C-F) are merged.
+CJK_BOUNDARIES = (
+    0x3400, 0x4DC0,  # CJK Unified Ideographs Extension A
+    0x4E00, 0xA000,  # CJK Unified Ideographs
+    0x20000, 0x2A6E0,  # CJK Unified Ideographs Extension B
+    0x2A700, 0x2EBF0,  # CJK Unified Ideographs Extensions C, D, E, F
+    0x30000, 0x31350,  # CJK Unified Ideographs Extension G
+)
+
 
 def is_chinese_character(char: str) -> bool:
     """Check if a character is a Chinese character (CJK Unified Ideographs)."""
-    code = ord(char)
-    return (
-        0x4E00 <= code <= 0x9FFF or  # CJK Unified Ideographs
-        0x3400 <= code <= 0x4DBF or  # CJK Unified Ideographs Extension A
-        0x20000 <= code <= 0x2A6DF or  # CJK Unified Ideographs Extension B
-        0x2A700 <= code <= 0x2B73F or  # CJK Unified Ideographs Extension C
-        0x2B740 <= code <= 0x2B81F or  # CJK Unified Ideographs Extension D
-        0x2B820 <= code <= 0x2CEAF or  # CJK Unified Ideographs Extension E
-        0x2CEB0 <= code <= 0x2EBEF or  # CJK Unified Ideographs Extension F
-        0x30000 <= code <= 0x3134F     # CJK Unified Ideographs Extension G
-    )
+    return bisect_right(CJK_BOUNDARIES, ord(char)) & 1 == 1
+
+
+def chinese_codes(text: str) -> np.ndarray:
+    """Code points of the Chinese characters of text, in order."""
+    # Same test as is_chinese_character, vectorized over the UTF-32 code points
+    # of the whole text instead of a Python-level call per character. With only
+    # five ranges, OR-ing range comparisons into one mask is several times
+    # faster than a per-code binary search (np.searchsorted).
+    codes = np.frombuffer(text.encode("utf-32-le", errors="surrogatepass"), dtype="<u4")
+    mask = np.zeros(codes.shape, dtype=bool)
+    for start, end in zip(CJK_BOUNDARIES[0::2], CJK_BOUNDARIES[1::2], strict=True):
+        mask |= (codes >= start) & (codes < end)
+    return codes[mask]
+
+
+def chinese_characters(text: str) -> str:
+    """Keep only the Chinese characters of text, in order."""
+    return chinese_codes(text).tobytes().decode("utf-32-le")
 
 
 def extract_chinese_characters(text: str) -> list[str]:
     """Extract all Chinese characters from text."""
-    return [char for char in text if is_chinese_character(char)]
-
+    return list(chinese_characters(text))
 
-def linearize_preorder(node: IDSNode) -> tuple[str, ...]:
-    """
-    Linearize a subtree in preorder (node, then children).
-    Returns a tuple of values.
-    """
-    if node.is_leaf():
-        return (node.value,)
 
-    result = [node.value]
-    for child in node.children:
-        result.extend(linearize_preorder(child))
-    return tuple(result)
+def count_characters_batch(batch: dict[str, list]) -> dict[str, list]:
+    """Count the Chinese characters of a batch of articles, one output row per character."""
+    # One mask over the whole batch, counted in NumPy; a str is only built
+    # once per distinct character, not per occurrence.
+    codes, counts = np.unique(chinese_codes("".join(text or "" for text in batch["text"])), return_counts=True)
+    return {"character": list(map(chr, codes.tolist())), "count": counts.tolist()}
 
 
 def find_all_subtree_patterns(node: IDSNode) -> list[tuple[str, ...]]:
@@ -63,48 +84,50 @@ def find_all_subtree_patterns(node: IDSNode) -> list[tuple[str, ...]]:
     """
     patterns = []
 
-    def traverse(node: IDSNode):
-        if node.is_leaf():
-            return
+    # Preorder walk with an explicit stack (children pushed in reverse so they
+    # pop in order) to emit patterns in the same order as a recursive walk.
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        children = node.children
+        if not children:
+            continue
 
-        # Linearize this subtree
-        if all(child.is_leaf() for child in node.children):
-            pattern = linearize_preorder(node)
-            patterns.append(pattern)
+        # A subtree whose children are all leaves linearizes to its value
+        # followed by its children's values
+        if all(not child.children for child in children):
+            patterns.append((node.value, *(child.value for child in children)))
 
-        # Continue traversing to find all subtrees
-        for child in node.children:
-            traverse(child)
+        stack.extend(reversed(children))
 
-    traverse(node)
     return patterns
 
 
-def main():
-    print("Loading Chinese Wikipedia dataset from HuggingFace...")
-    dataset = load_dataset("Jax-dan/zhwiki-latest", split="train", streaming=True)
-    dataset = dataset.take(1000)  # Limit for testing
-
-    print("Extracting and counting Chinese characters...")
-    character_counter = Counter()
-
-    # Process dataset
-    for item in tqdm(dataset, desc="Processing articles"):
-        text = item.get('text', '')
-        characters = extract_chinese_characters(text)
-        character_counter.update(characters)
+@cache
+def ids_subtree_pattern_counts(ids: str) -> tuple[tuple[tuple[str, ...], int], ...]:
+    """
+    Subtree patterns of an IDS string with how often each occurs in it,
+    memoized per IDS (many characters share one).
+    Returns an empty tuple if the IDS fails to parse.
+    """
+    try:
+        tree = parse_ideographic_description_sequences(ids)
+    except Exception:  # noqa: BLE001
+        # Skip characters that fail to parse (various parsing errors possible from IDS data)
+        return ()
+    return tuple(Counter(find_all_subtree_patterns(tree)).items())
 
-    print(f"\nTotal unique characters found: {len(character_counter)}")
-    print(f"Total character occurrences: {sum(character_counter.values())}")
 
-    print("\nDecomposing characters and analyzing all subtree patterns...")
-    pattern_counter = Counter()
-    characters_processed = 0
+def analyze_characters(items: list[tuple[str, int]]) -> tuple[dict[tuple[str, ...], int], int]:
+    """
+    Count subtree patterns of (character, frequency) items, weighted by frequency.
+    Returns the pattern counts and how many of the characters have an IDS.
+    """
+    # A plain dict: Counter's Python-level __missing__ would run on every new pattern
+    pattern_counter: dict[tuple[str, ...], int] = {}
     characters_with_ids = 0
 
-    for char, freq in tqdm(character_counter.items(), desc="Analyzing characters"):
-        characters_processed += 1
-
+    for char, freq in items:
         # Get IDS for character
         ids = get_ids_for_character(char)
         if ids is None:
@@ -112,19 +135,70 @@ def main():
 
         characters_with_ids += 1
 
-        try:
-            # Parse IDS into tree
-            tree = parse_ideographic_description_sequences(ids)
+        # Count patterns weighted by character frequency
+        for pattern, count in ids_subtree_pattern_counts(ids):
+            pattern_counter[pattern] = pattern_counter.get(pattern, 0) + count * freq
+
+    return pattern_counter, characters_with_ids
+
+
+def chunked(items, size: int):
+    """Split an iterable into lists of at most `size` items."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def analyze_characters_parallel(items, chunk_size: int = 4096, max_workers: int | None = None,
+                                mp_context=None) -> tuple[Counter, int]:
+    """analyze_characters over chunks of items across processes, with the partial counts summed."""
+    # Characters are independent, so chunks are analyzed across processes, each
+    # with its own IDS caches. Workers start with the platform's default method
+    # (or mp_context); only forked ones inherit the dictionary loaded here.
+    load_characters_dictionary()
+    pattern_counter = Counter()
+    characters_with_ids = 0
+
+    # Results are combined in chunk order (not completion order), so the
+    # counter's insertion order, and with it how ties rank, is stable.
+    chunks = list(chunked(items, chunk_size))
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+        results = executor.map(analyze_characters, chunks)
+        for chunk_patterns, chunk_with_ids in tqdm(results, total=len(chunks), desc="Analyzing characters"):
+            pattern_counter.update(chunk_patterns)
+            characters_with_ids += chunk_with_ids
+
+    return pattern_counter, characters_with_ids
 
-            # Find all subtree patterns
-            patterns = find_all_subtree_patterns(tree)
 
-            # Count patterns weighted by character frequency
-            for pattern in patterns:
-                pattern_counter[pattern] += freq
-        except Exception:  # noqa: BLE001
-            # Skip characters that fail to parse (various parsing errors possible from IDS data)
-            pass
+def main():
+    print("Loading Chinese Wikipedia dataset from HuggingFace...")
+    # Stream just the articles we use (limit for testing), then materialize
+    # them so the counting below can be spread over processes
+    stream = load_dataset("Jax-dan/zhwiki-latest", split="train", streaming=True)
+    dataset = Dataset.from_list(list(stream.take(1000)))
+
+    print("Extracting and counting Chinese characters...")
+    # Count per batch across processes; each batch returns its partial counts
+    # as (character, count) rows, which are summed here.
+    batch_counts = dataset.map(
+        count_characters_batch,
+        batched=True,
+        batch_size=100,
+        num_proc=os.cpu_count(),
+        remove_columns=dataset.column_names,
+        desc="Processing articles",
+    )
+    character_counter = Counter()
+    for char, count in zip(batch_counts["character"], batch_counts["count"], strict=True):
+        character_counter[char] += count
+
+    print(f"\nTotal unique characters found: {len(character_counter)}")
+    print(f"Total character occurrences: {sum(character_counter.values())}")
+
+    print("\nDecomposing characters and analyzing all subtree patterns...")
+    characters_processed = len(character_counter)
+    pattern_counter, characters_with_ids = analyze_characters_parallel(character_counter.items())
 
     print(f"\nCharacters processed: {characters_processed}")
     print(f"Characters with IDS: {characters_with_ids}")
@@ -137,10 +211,12 @@ def main():
     print(f"{'Rank':<6} {'Compression':<15} {'Frequency':<15} {'Pattern':<8} {'Character (if Exists)'}")
     print("-"*80)
 
-    pricing = Counter({pattern: len(pattern) * count for pattern, count in pattern_counter.items()})
+    # Select the top 50 by price straight from the counts, without building a
+    # second full dict of prices just to sort it
+    top = heapq.nlargest(50, pattern_counter.items(), key=lambda item: len(item[0]) * item[1])
 
-    for rank, (pattern, price) in enumerate(pricing.most_common(50), 1):
-        freq = pattern_counter[pattern]
+    for rank, (pattern, freq) in enumerate(top, 1):
+        price = len(pattern) * freq
         pattern_str = "".join(pattern)
         print(f"{rank:<6} {price:<15,} {freq:<15,} {pattern_str:<8} {get_character_for_ids(pattern_str)}")
 
@@ -28,24 +28,23 @@ from functools import cache
 from pathlib import Path
 
 # IDCs that take 2 components
-BINARY_IDCS = set('⿰⿱⿴⿵⿶⿷⿸⿹⿺⿻')
+BINARY_IDCS = frozenset('⿰⿱⿴⿵⿶⿷⿸⿹⿺⿻')
 
 # IDCs that take 3 components
-TERNARY_IDCS = set('⿲⿳')
+TERNARY_IDCS = frozenset('⿲⿳')
 
 # All IDCs
 ALL_IDCS = BINARY_IDCS | TERNARY_IDCS
 
+# Number of components each IDC takes
+IDC_ARITY = {idc: 2 for idc in BINARY_IDCS} | {idc: 3 for idc in TERNARY_IDCS}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class IDSNode:
     """Represents a node in the IDS tree."""
     value: str
-    children: list['IDSNode'] = None
-
-    def __post_init__(self):
-        if self.children is None:
-            self.children = []
+    children: tuple['IDSNode', ...] = ()
 
     def is_leaf(self) -> bool:
         """Check if this node is a leaf (radical)."""
@@ -67,6 +66,9 @@ class IDSNode:
             }
 
 
+# Memoized: parsed trees are immutable (frozen IDSNode), and the same IDS
+# strings are parsed again and again (shared components, repeated lookups).
+@cache
 def parse_ideographic_description_sequences(ids: str) -> IDSNode:
     """
     Parse an Ideographic Description Sequence into a tree structure.
@@ -87,34 +89,33 @@ def parse_ideographic_description_sequences(ids: str) -> IDSNode:
     if not ids:
         raise ValueError("Empty IDS string")
 
-    index = [0]  # Use list to maintain reference in nested function
-
-    def parse_node() -> IDSNode:
-        if index[0] >= len(ids):
-            raise ValueError(f"Unexpected end of IDS string at position {index[0]}")
-
-        char = ids[index[0]]
-        index[0] += 1
-
-        if char in TERNARY_IDCS:
-            # Parse 3 children
-            node = IDSNode(value=char)
-            node.children = [parse_node() for _ in range(3)]
-            return node
-        elif char in BINARY_IDCS:
-            # Parse 2 children
-            node = IDSNode(value=char)
-            node.children = [parse_node() for _ in range(2)]
-            return node
+    root = None
+    # Templates still waiting for components, as (value, arity, children so far)
+    pending: list[tuple[str, int, list[IDSNode]]] = []
+    for position, char in enumerate(ids):
+        if root is not None:
+            raise ValueError(f"Extra characters after parsing: {ids[position:]}")
+
+        arity = IDC_ARITY.get(char)
+        if arity is not None:
+            pending.append((char, arity, []))
+            continue
+
+        # A radical completes every innermost template it fills, so build
+        # those nodes (children are immutable tuples) as they close
+        node = IDSNode(value=char)
+        while pending:
+            value, arity, children = pending[-1]
+            children.append(node)
+            if len(children) < arity:
+                break
+            pending.pop()
+            node = IDSNode(value=value, children=tuple(children))
         else:
-            # Leaf node (radical)
-            return IDSNode(value=char)
-
-    root = parse_node()
+            root = node
 
-    # Verify we consumed the entire string
-    if index[0] < len(ids):
-        raise ValueError(f"Extra characters after parsing: {ids[index[0]:]}")
+    if root is None:
+        raise ValueError(f"Unexpected end of IDS string at position {len(ids)}")
 
     return root
 
@@ -158,9 +159,7 @@ def ids_tree_to_string(node: IDSNode, prefix: str = "", is_last: bool = True) ->
 def load_characters_dictionary():
     """Load the IDS dictionary from the JSON file."""
     dictionary_path = Path(__file__).parent / "dictionary.json"
-    with open(dictionary_path, encoding='utf-8') as f:
-        dictionary = json.load(f)
-    return dictionary
+    return json.loads(dictionary_path.read_bytes())
 
 @cache
 def reversed_characters_dictionary():
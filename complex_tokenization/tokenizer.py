@@ -13,7 +13,7 @@ With language-specific decomposition:
 """
 
 from collections.abc import Callable
-from functools import lru_cache, reduce
+from functools import lru_cache, partial
 
 from tokenizers.pre_tokenizers import PreTokenizer
 
@@ -64,15 +64,15 @@ class Tokenizer:
         # copies. The cache is local to the build, so it's freed before training
         # (no pinning of pre-merge graphs) and can't leak a settings-dependent
         # graph to a later run. cache_maxsize=None is unbounded; 0 disables.
-        if self.cache_maxsize == 0:
-            units = self.units
-        else:
-            units = lru_cache(maxsize=self.cache_maxsize)(self.units)
-        return tuple(
-            words(text, connected=self.connected, units=units,
-                  pretokenizer=self.pretokenizer)
-            for text in texts
-        )
+        # Identical texts (headers, boilerplate) are likewise built once and
+        # share one graph, so merge_shared merges them once per step.
+        units = self.units
+        if self.cache_maxsize != 0:
+            units = lru_cache(maxsize=self.cache_maxsize)(units)
+        build = partial(words, connected=self.connected, units=units, pretokenizer=self.pretokenizer)
+        if self.cache_maxsize != 0:
+            build = lru_cache(maxsize=self.cache_maxsize)(build)
+        return tuple(build(text) for text in texts)
 
     def make_trainer(self, texts: list[str]) -> Trainer:
         GraphSettings.ONLY_MINIMAL_MERGES = True
@@ -82,8 +82,9 @@ class Tokenizer:
         trainer = Trainer(graphs=graphs)
 
         for merge_strs in self.merges:
-            nodes = tuple(Node(value=str_to_bytes(s)) for s in merge_strs)
-            token = reduce(lambda a, b: a + b, nodes)
+            values = [str_to_bytes(s) for s in merge_strs]
+            nodes = tuple(Node(value=value) for value in values)
+            token = Node(value=b"".join(values))
             trainer.graph = trainer.graph.merge(token, nodes)
             trainer.merges.append((token, nodes))
 
@@ -1,7 +1,7 @@
 from collections import Counter, defaultdict
 from functools import reduce
 
-from complex_tokenization.draw import create_gif, draw_dot_content
+from complex_tokenization.draw import create_gif, draw_dot_contents
 from complex_tokenization.graph import GraphVertex, Tree, UnconnectedGraphs
 from complex_tokenization.graphs.units import utf8
 
@@ -58,7 +58,7 @@ class Trainer:
         frames = []
         for _ in self._steps(num_merges, progress):
             if draw:
-                frames.append(draw_dot_content("\n".join(self.graph.dot())))
+                frames.append("\n".join(self.graph.dot()))
 
             counts = Counter(self.graph.get_merges())
             if not counts:
@@ -73,7 +73,8 @@ class Trainer:
             self.merges.append((token, nodes))
 
         if draw:
-            create_gif(frames, save="example.gif").show()
+            # Rendered together at the end: one dot process for all the frames
+            create_gif(draw_dot_contents(frames), save="example.gif").show()
 
     def _train_incremental(self, num_merges: int, progress: bool = False):
         # Rebuilding Counter(graph.get_merges()) every step recounts the whole
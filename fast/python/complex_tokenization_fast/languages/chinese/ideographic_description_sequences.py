@@ -22,27 +22,29 @@ Ternary IDCs (take 3 components):
 ⿳ (U+2FF3) - above to middle to below
 """
 
-import json
 from dataclasses import dataclass
 from functools import cache
 from pathlib import Path
 
-BINARY_IDCS = set('⿰⿱⿴⿵⿶⿷⿸⿹⿺⿻')
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; the stdlib parser reads the same bytes
+    from json import loads as json_loads
 
-TERNARY_IDCS = set('⿲⿳')
+BINARY_IDCS = frozenset('⿰⿱⿴⿵⿶⿷⿸⿹⿺⿻')
+
+TERNARY_IDCS = frozenset('⿲⿳')
 
 ALL_IDCS = BINARY_IDCS | TERNARY_IDCS
 
+IDC_ARITY = {idc: 2 for idc in BINARY_IDCS} | {idc: 3 for idc in TERNARY_IDCS}
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IDSNode:
     """Represents a node in the IDS tree."""
     value: str
-    children: list['IDSNode'] = None
-
-    def __post_init__(self):
-        if self.children is None:
-            self.children = []
+    children: tuple['IDSNode', ...] = ()
 
     def is_leaf(self) -> bool:
         return len(self.children) == 0
@@ -61,6 +63,7 @@ class IDSNode:
             }
 
 
+@cache
 def parse_ideographic_description_sequences(ids: str) -> IDSNode:
     """
     Parse an Ideographic Description Sequence into a tree structure.
@@ -82,30 +85,30 @@ def parse_ideographic_description_sequences(ids: str) -> IDSNode:
     if not ids:
         raise ValueError("Empty IDS string")
 
-    index = [0]
-
-    def parse_node() -> IDSNode:
-        if index[0] >= len(ids):
-            raise ValueError(f"Unexpected end of IDS string at position {index[0]}")
-
-        char = ids[index[0]]
-        index[0] += 1
-
-        if char in TERNARY_IDCS:
-            node = IDSNode(value=char)
-            node.children = [parse_node() for _ in range(3)]
-            return node
-        elif char in BINARY_IDCS:
-            node = IDSNode(value=char)
-            node.children = [parse_node() for _ in range(2)]
-            return node
+    root = None
+    pending: list[tuple[str, int, list[IDSNode]]] = []
+    for position, char in enumerate(ids):
+        if root is not None:
+            raise ValueError(f"Extra characters after parsing: {ids[position:]}")
+
+        arity = IDC_ARITY.get(char)
+        if arity is not None:
+            pending.append((char, arity, []))
+            continue
+
+        node = IDSNode(value=char)
+        while pending:
+            value, arity, children = pending[-1]
+            children.append(node)
+            if len(children) < arity:
+                break
+            pending.pop()
+            node = IDSNode(value=value, children=tuple(children))
         else:
-            return IDSNode(value=char)
-
-    root = parse_node()
+            root = node
 
-    if index[0] < len(ids):
-        raise ValueError(f"Extra characters after parsing: {ids[index[0]:]}")
+    if root is None:
+        raise ValueError(f"Unexpected end of IDS string at position {len(ids)}")
 
     return root
 
@@ -133,9 +136,7 @@ def ids_tree_to_string(node: IDSNode, prefix: str = "", is_last: bool = True) ->
 @cache
 def load_characters_dictionary():
     dictionary_path = Path(__file__).parent / "dictionary.json"
-    with open(dictionary_path, encoding='utf-8') as f:
-        dictionary = json.load(f)
-    return dictionary
+    return json_loads(dictionary_path.read_bytes())
 
 @cache
 def reversed_characters_dictionary():
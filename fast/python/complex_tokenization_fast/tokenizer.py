@@ -1,4 +1,4 @@
-from functools import lru_cache, reduce
+from functools import lru_cache, partial
 
 from complex_tokenization_fast._rs import (
     Node,
@@ -42,15 +42,15 @@ class Tokenizer:
 
     def _build_graphs(self, texts):
         # Same build-local word-graph dedup as the reference: repeated words
-        # share one graph. cache_maxsize=None is unbounded; 0 disables.
-        if self.cache_maxsize == 0:
-            units = self.units
-        else:
-            units = lru_cache(maxsize=self.cache_maxsize)(self.units)
-        return tuple(
-            words(text, connected=self.connected, units=units, pretokenizer=self.pretokenizer)
-            for text in texts
-        )
+        # share one graph, and so do identical texts. cache_maxsize=None is
+        # unbounded; 0 disables.
+        units = self.units
+        if self.cache_maxsize != 0:
+            units = lru_cache(maxsize=self.cache_maxsize)(units)
+        build = partial(words, connected=self.connected, units=units, pretokenizer=self.pretokenizer)
+        if self.cache_maxsize != 0:
+            build = lru_cache(maxsize=self.cache_maxsize)(build)
+        return tuple(build(text) for text in texts)
 
     def make_trainer(self, texts):
         GraphSettings.ONLY_MINIMAL_MERGES = True
@@ -73,8 +73,9 @@ class Tokenizer:
         if self.merges:
             merge_list = []
             for merge_strs in self.merges:
-                nodes = tuple(Node(value=str_to_bytes(s)) for s in merge_strs)
-                token = reduce(lambda a, b: a + b, nodes)
+                values = [str_to_bytes(s) for s in merge_strs]
+                nodes = tuple(Node(value=value) for value in values)
+                token = Node(value=b"".join(values))
                 merge_list.append((token, nodes))
             trainer.apply_merges(merge_list)
 
@@ -98,8 +99,9 @@ class Tokenizer:
         if self.merges:
             merge_list = []
             for merge_strs in self.merges:
-                nodes = tuple(Node(value=str_to_bytes(s)) for s in merge_strs)
-                token = reduce(lambda a, b: a + b, nodes)
+                values = [str_to_bytes(s) for s in merge_strs]
+                nodes = tuple(Node(value=value) for value in values)
+                token = Node(value=b"".join(values))
                 merge_list.append((token, nodes))
             trainer.apply_merges(merge_list)
 
@@ -3,18 +3,23 @@ import pytest
 from complex_tokenization.graphs.settings import GraphSettings
 from complex_tokenization.graphs.units import _cluster_handlers
 
+GRAPH_SETTINGS = ("MAX_MERGE_SIZE", "ONLY_MINIMAL_MERGES", "TRADE_MEMORY_FOR_SPEED")
+
+
+def save_graph_settings() -> dict:
+    return {name: getattr(GraphSettings, name) for name in GRAPH_SETTINGS}
+
+
+def restore_graph_settings(saved: dict):
+    for name, value in saved.items():
+        setattr(GraphSettings, name, value)
+
 
 @pytest.fixture(autouse=True)
 def reset_graph_settings():
-    original = {
-        "MAX_MERGE_SIZE": GraphSettings.MAX_MERGE_SIZE,
-        "ONLY_MINIMAL_MERGES": GraphSettings.ONLY_MINIMAL_MERGES,
-        "TRADE_MEMORY_FOR_SPEED": GraphSettings.TRADE_MEMORY_FOR_SPEED,
-    }
+    original = save_graph_settings()
     yield
-    GraphSettings.MAX_MERGE_SIZE = original["MAX_MERGE_SIZE"]
-    GraphSettings.ONLY_MINIMAL_MERGES = original["ONLY_MINIMAL_MERGES"]
-    GraphSettings.TRADE_MEMORY_FOR_SPEED = original["TRADE_MEMORY_FOR_SPEED"]
+    restore_graph_settings(original)
 
 
 @pytest.fixture(autouse=True)
@@ -22,3 +27,32 @@ def clear_script_registry():
     _cluster_handlers.clear()
     yield
     _cluster_handlers.clear()
+
+
+@pytest.fixture(scope="session")
+def small_dataset():
+    # Loaded once per session and shared by every module that trains on it;
+    # a tuple, so no test can mutate the sample under the others
+    from tests.utils import text_dataset
+    return tuple(text_dataset(max_samples=10))
+
+
+# Trained once per session: several modules check the same 10 merges of the
+# small sample (against expectations and against each other).
+@pytest.fixture(scope="session")
+def huggingface_merges_10(small_dataset):
+    from tests.utils import train_huggingface_tokenizer
+    return train_huggingface_tokenizer(small_dataset, num_merges=10)
+
+
+@pytest.fixture(scope="session")
+def bpe_merges_10(small_dataset):
+    from complex_tokenization.tokenizer import BPETokenizer
+
+    # Training sets GraphSettings; restore them here, since this runs before the
+    # requesting test's reset_graph_settings takes its snapshot
+    saved = save_graph_settings()
+    try:
+        return BPETokenizer().train(small_dataset, num_merges=10)
+    finally:
+        restore_graph_settings(saved)
@@ -0,0 +1,15 @@
+import json
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def chinese_dictionary():
+    """dictionary.json, read and parsed once per session for the Chinese tests."""
+    dictionary_path = Path(__file__).parent.parent / "complex_tokenization" / "chinese" / "dictionary.json"
+
+    if not dictionary_path.exists():
+        pytest.skip("dictionary.json not found")
+
+    return json.loads(dictionary_path.read_bytes())
@@ -1,66 +1,40 @@
-import json
-from pathlib import Path
+from collections import defaultdict
 
 import pytest
 
 from complex_tokenization.languages.chinese.ideographic_description_sequences import (
+    IDSNode,
     ids_tree_to_string,
     parse_ideographic_description_sequences,
 )
 
 
-class TestDictionary:
-    def test_all_values_unique(self):
-        """Test that all values in dictionary.json are unique"""
-        dictionary_path = Path(__file__).parent.parent / "complex_tokenization" / "chinese" / "dictionary.json"
-
-        if not dictionary_path.exists():
-            pytest.skip("dictionary.json not found")
+def group_keys_by_value(dictionary):
+    value_keys = defaultdict(list)
+    for k, v in dictionary.items():
+        value_keys[v].append(k)
+    return value_keys
 
-        with open(dictionary_path) as f:
-            dictionary = json.load(f)
 
-        values = list(dictionary.values())
-        unique_values = set(values)
+class TestDictionary:
+    def test_all_values_unique(self, chinese_dictionary):
+        """Test that all values in dictionary.json are unique"""
+        value_keys = group_keys_by_value(chinese_dictionary)
+        duplicates = {v: len(keys) for v, keys in value_keys.items() if len(keys) > 1}
 
-        if len(values) != len(unique_values):
-            # Find duplicates
-            from collections import Counter
-            value_counts = Counter(values)
-            duplicates = {v: count for v, count in value_counts.items() if count > 1}
+        if duplicates:
             # Sort by count descending, then by value for stable ordering
             top_duplicates = sorted(duplicates.items(), key=lambda x: (-x[1], x[0]))[:20]
-            top_duplicates_str = [(f"{v}: {count} occurrences "
-                                   f"({'/'.join([k for k, val in dictionary.items() if val == v])})")
+            top_duplicates_str = [f"{v}: {count} occurrences ({'/'.join(value_keys[v])})"
                                   for v, count in top_duplicates]
-            pytest.fail(f"Found {len(duplicates)} ({len(values) - len(unique_values)}) duplicate values:\n"
+            extra = sum(duplicates.values()) - len(duplicates)
+            pytest.fail(f"Found {len(duplicates)} ({extra}) duplicate values:\n"
                         + "\n".join(top_duplicates_str))
 
 
-class TestIdeographicDescriptionSequences:
-    def test_parse_complex_nested(self):
-        """Test parsing: ⿱⿳𠂊田一⿰⿳𠂊田一⿳𠂊田一"""
-        ids = "⿱⿳𠂊田一⿰⿳𠂊田一⿳𠂊田一"
-        tree = parse_ideographic_description_sequences(ids)
-
-        # Check root
-        assert tree.value == "⿱"
-        assert len(tree.children) == 2
-
-        # Check first child (⿳𠂊田一)
-        first_child = tree.children[0]
-        assert first_child.value == "⿳"
-        assert len(first_child.children) == 3
-        assert first_child.children[0].value == "𠂊"
-        assert first_child.children[1].value == "田"
-        assert first_child.children[2].value == "一"
-
-        # Check second child (⿰⿳𠂊田一⿳𠂊田一)
-        second_child = tree.children[1]
-        assert second_child.value == "⿰"
-        assert len(second_child.children) == 2
-
-        expected_tree = """└── Template: ⿱
+# (ids, expected ascii tree) for parse_ideographic_description_sequences
+PARSE_CASES = [
+    pytest.param("⿱⿳𠂊田一⿰⿳𠂊田一⿳𠂊田一", """└── Template: ⿱
     ├── Template: ⿳
     │   ├── Radical: 𠂊
     │   ├── Radical: 田
@@ -74,19 +48,8 @@ class TestIdeographicDescriptionSequences:
             ├── Radical: 𠂊
             ├── Radical: 田
             └── Radical: 一
-"""
-        assert ids_tree_to_string(tree) == expected_tree
-
-    def test_parse_with_surround(self):
-        """Test parsing: ⿰⿳爫龴⿵冂⿱厶又乚"""
-        ids = "⿰⿳爫龴⿵冂⿱厶又乚"
-        tree = parse_ideographic_description_sequences(ids)
-
-        # Check root
-        assert tree.value == "⿰"
-        assert len(tree.children) == 2
-
-        expected_tree = """└── Template: ⿰
+""", id="complex_nested"),
+    pytest.param("⿰⿳爫龴⿵冂⿱厶又乚", """└── Template: ⿰
     ├── Template: ⿳
     │   ├── Radical: 爫
     │   ├── Radical: 龴
@@ -96,43 +59,50 @@ class TestIdeographicDescriptionSequences:
     │           ├── Radical: 厶
     │           └── Radical: 又
     └── Radical: 乚
-"""
-        assert ids_tree_to_string(tree) == expected_tree
-
-    def test_parse_with_overlay(self):
-        """Test parsing: ⿱⿻⿻コ一丨一"""
-        ids = "⿱⿻⿻コ一丨一"
-        tree = parse_ideographic_description_sequences(ids)
-
-        # Check root
-        assert tree.value == "⿱"
-        assert len(tree.children) == 2
-
-        expected_tree = """└── Template: ⿱
+""", id="with_surround"),
+    pytest.param("⿱⿻⿻コ一丨一", """└── Template: ⿱
     ├── Template: ⿻
     │   ├── Template: ⿻
     │   │   ├── Radical: コ
     │   │   └── Radical: 一
     │   └── Radical: 丨
     └── Radical: 一
-"""
+""", id="with_overlay"),
+    pytest.param("⿰木木", """└── Template: ⿰
+    ├── Radical: 木
+    └── Radical: 木
+""", id="simple_binary"),
+]
+
+
+class TestIdeographicDescriptionSequences:
+    @pytest.mark.parametrize(("ids", "expected_tree"), PARSE_CASES)
+    def test_parse(self, ids, expected_tree):
+        """Test that parsing renders the expected tree"""
+        tree = parse_ideographic_description_sequences(ids)
         assert ids_tree_to_string(tree) == expected_tree
 
-    def test_simple_binary(self):
-        """Test simple binary IDS: ⿰木木"""
-        ids = "⿰木木"
+    def test_parse_complex_nested(self):
+        """Test parsing: ⿱⿳𠂊田一⿰⿳𠂊田一⿳𠂊田一"""
+        ids = "⿱⿳𠂊田一⿰⿳𠂊田一⿳𠂊田一"
         tree = parse_ideographic_description_sequences(ids)
 
-        assert tree.value == "⿰"
+        # Check root
+        assert tree.value == "⿱"
         assert len(tree.children) == 2
-        assert tree.children[0].value == "木"
-        assert tree.children[1].value == "木"
 
-        expected_tree = """└── Template: ⿰
-    ├── Radical: 木
-    └── Radical: 木
-"""
-        assert ids_tree_to_string(tree) == expected_tree
+        # Check first child (⿳𠂊田一)
+        first_child = tree.children[0]
+        assert first_child.value == "⿳"
+        assert len(first_child.children) == 3
+        assert first_child.children[0].value == "𠂊"
+        assert first_child.children[1].value == "田"
+        assert first_child.children[2].value == "一"
+
+        # Check second child (⿰⿳𠂊田一⿳𠂊田一)
+        second_child = tree.children[1]
+        assert second_child.value == "⿰"
+        assert len(second_child.children) == 2
 
     def test_empty_string_raises_error(self):
         """Test that empty string raises ValueError"""
@@ -151,17 +121,23 @@ class TestIdeographicDescriptionSequences:
         assert result["children"][0]["type"] == "radical"
         assert result["children"][0]["value"] == "木"
 
-    def test_all_dictionary_items_parseable(self):
+    def test_parsed_tree_is_immutable(self):
+        """Test that parsed trees are frozen, hashable and compare by value"""
+        tree = parse_ideographic_description_sequences("⿰木木")
+        expected = IDSNode("⿰", (IDSNode("木"), IDSNode("木")))
+        assert isinstance(tree.children, tuple)
+        assert tree == expected
+        assert hash(tree) == hash(expected)
+        with pytest.raises(AttributeError):
+            tree.value = "⿱"
+
+    def test_parse_is_cached(self):
+        """Test that parsing the same IDS again returns the same (shared) tree"""
+        assert parse_ideographic_description_sequences("⿰木木") is parse_ideographic_description_sequences("⿰木木")
+
+    def test_all_dictionary_items_parseable(self, chinese_dictionary):
         """Test that all items in dictionary.json are parseable"""
-        dictionary_path = Path(__file__).parent.parent / "complex_tokenization" / "chinese" / "dictionary.json"
-
-        if not dictionary_path.exists():
-            pytest.skip("dictionary.json not found")
-
-        with open(dictionary_path) as f:
-            dictionary = json.load(f)
-
-        templates = list(dictionary.values())
+        templates = list(chinese_dictionary.values())
 
         for template in templates:
             parse_ideographic_description_sequences(template)
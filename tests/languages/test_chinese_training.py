@@ -71,3 +71,19 @@ class TestChineseTraining:
         assert any(wood in mb for mb in merge_bytes), (
             "Expected '木' in merge bytes within 20 merges"
         )
+
+    def test_memoization_matches_unmemoized(self):
+        # Tree.get_merges and Tree.merge use the memoized merges when
+        # TRADE_MEMORY_FOR_SPEED is on; training must not depend on it
+        from complex_tokenization.tokenizer import BPETokenizer
+
+        register_script("Han", chinese_character_to_graph)
+        texts = ["亮亮亮 林森林森 好好", "林森木本末朱机杏 亮"] * 3
+
+        GraphSettings.TRADE_MEMORY_FOR_SPEED = False
+        plain = BPETokenizer().train(texts, num_merges=40)
+        GraphSettings.TRADE_MEMORY_FOR_SPEED = True
+        memoized = BPETokenizer().train(texts, num_merges=40)
+
+        assert any(len(merge) > 2 for merge in plain), f"Expected tree merges in {plain}"
+        assert memoized == plain
@@ -0,0 +1,33 @@
+import pytest
+
+# A build script of the reference package only; the fast package has no copy
+create_dictionary = pytest.importorskip("complex_tokenization.languages.chinese.create_dictionary")
+expand_dictionary = create_dictionary.expand_dictionary
+expand_ids = create_dictionary.expand_ids
+
+
+class TestExpandDictionary:
+    def test_expands_nested_components(self):
+        dictionary = {"林": "⿰木木", "森": "⿱木林", "木": "⿻十八"}
+        assert expand_dictionary(dictionary) == {
+            "林": "⿰⿻十八⿻十八",
+            "森": "⿱⿻十八⿰⿻十八⿻十八",
+            "木": "⿻十八",
+        }
+
+    def test_skips_entries_with_unencoded_components(self):
+        # 丙 is only unencoded through its component 乙, but is still skipped
+        dictionary = {"甲": "⿱{01}十", "乙": "⿰甲口", "丙": "⿱乙一", "丁": "⿱一亅"}
+        assert expand_dictionary(dictionary) == {"丁": "⿱一亅"}
+
+    def test_skip_rule_does_not_depend_on_key_order(self):
+        # The unencoded component is reached before or after its users alike
+        entries = [("甲", "⿱{01}十"), ("乙", "⿰甲口"), ("丁", "⿱一亅"), ("戊", "⿰丁丁")]
+        expected = {"丁": "⿱一亅", "戊": "⿰⿱一亅⿱一亅"}
+        assert expand_dictionary(dict(entries)) == expected
+        assert expand_dictionary(dict(reversed(entries))) == expected
+
+    def test_cyclic_entries_stop_at_the_repeated_character(self):
+        dictionary = {"甲": "⿰乙口", "乙": "⿱甲一"}
+        assert expand_ids("甲", dictionary) == "⿰⿱甲一口"
+        assert expand_dictionary(dictionary) == {"甲": "⿰⿱甲一口", "乙": "⿱⿰乙口一"}
@@ -0,0 +1,97 @@
+import multiprocessing
+from collections import Counter
+
+import pytest
+
+# An analysis script of the reference package only; the fast package has no copy
+frequency = pytest.importorskip("complex_tokenization.languages.chinese.frequency")
+
+# Mixed scripts, with characters from CJK Extension A (㐀), B (𠀀) and G (𰀀)
+# next to CJK punctuation (。), kana (の) and a compatibility ideograph (豈)
+MIXED_TEXT = "中文 text, 㐀𠀀𰀀。日本語の漢字! 豈 עברית 中中"
+
+
+def expected_characters(text):
+    return [char for char in text if frequency.is_chinese_character(char)]
+
+
+class TestChineseCharacters:
+    def test_matches_per_character_check(self):
+        assert frequency.extract_chinese_characters(MIXED_TEXT) == expected_characters(MIXED_TEXT)
+        assert frequency.chinese_characters(MIXED_TEXT) == "".join(expected_characters(MIXED_TEXT))
+
+    def test_codes_are_code_points(self):
+        assert frequency.chinese_codes(MIXED_TEXT).tolist() == [ord(c) for c in expected_characters(MIXED_TEXT)]
+
+    def test_range_boundaries(self):
+        # Each range's first and last code points are inside; the ones just outside are not
+        starts, ends = frequency.CJK_BOUNDARIES[0::2], frequency.CJK_BOUNDARIES[1::2]
+        inside = [chr(start) for start in starts] + [chr(end - 1) for end in ends]
+        outside = [chr(start - 1) for start in starts] + [chr(end) for end in ends]
+        assert frequency.chinese_characters("".join(inside + outside)) == "".join(inside)
+
+    def test_no_chinese(self):
+        assert frequency.chinese_characters("plain ascii") == ""
+        assert frequency.extract_chinese_characters("") == []
+
+
+class TestCountCharactersBatch:
+    def test_matches_counter(self):
+        texts = [MIXED_TEXT, "", None, "中文中文"]
+        rows = frequency.count_characters_batch({"text": texts})
+        expected = Counter(char for text in texts if text for char in expected_characters(text))
+        assert dict(zip(rows["character"], rows["count"], strict=True)) == expected
+        assert len(rows["character"]) == len(expected)
+
+    def test_batched_map_totals_match_counter(self):
+        # As in main: per-batch rows from a batched map, summed afterwards. In
+        # process: num_proc would fork from the (multi-threaded) pytest-xdist worker
+        from datasets import Dataset
+
+        texts = [MIXED_TEXT, "中文", "no chinese", "漢字漢字", MIXED_TEXT]
+        dataset = Dataset.from_list([{"text": text} for text in texts])
+        rows = dataset.map(frequency.count_characters_batch, batched=True, batch_size=2,
+                           remove_columns=dataset.column_names)
+        totals = Counter()
+        for char, count in zip(rows["character"], rows["count"], strict=True):
+            totals[char] += count
+        assert totals == Counter(char for text in texts for char in expected_characters(text))
+
+    def test_no_chinese(self):
+        assert frequency.count_characters_batch({"text": ["plain ascii"]}) == {"character": [], "count": []}
+
+
+# (character, frequency) items; 𰀀 has no IDS in the dictionary
+CHARACTER_ITEMS = [("林", 5), ("森", 2), ("好", 3), ("語", 1), ("𰀀", 7), ("漢", 4)]
+
+
+class TestAnalyzeCharacters:
+    def test_chunked(self):
+        assert list(frequency.chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert list(frequency.chunked([], 3)) == []
+
+    def test_weighted_pattern_counts(self):
+        expected = Counter()
+        with_ids = 0
+        for char, freq in CHARACTER_ITEMS:
+            ids = frequency.get_ids_for_character(char)
+            if ids is None:
+                continue
+            with_ids += 1
+            tree = frequency.parse_ideographic_description_sequences(ids)
+            for pattern in frequency.find_all_subtree_patterns(tree):
+                expected[pattern] += freq
+
+        patterns, characters_with_ids = frequency.analyze_characters(CHARACTER_ITEMS)
+        assert patterns == expected
+        assert characters_with_ids == with_ids
+
+    def test_parallel_matches_serial(self):
+        # A single spawned worker: forking from a (multi-threaded) pytest-xdist worker can deadlock
+        serial_patterns, serial_with_ids = frequency.analyze_characters(CHARACTER_ITEMS)
+        patterns, characters_with_ids = frequency.analyze_characters_parallel(
+            CHARACTER_ITEMS, chunk_size=2, max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        assert patterns == serial_patterns
+        # Chunks are combined in order, so even the insertion order matches
+        assert list(patterns) == list(serial_patterns)
+        assert characters_with_ids == serial_with_ids
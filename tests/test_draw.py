@@ -0,0 +1,58 @@
+from io import BytesIO
+
+import pytest
+
+pytest.importorskip("graphviz")
+Image = pytest.importorskip("PIL.Image")
+
+from complex_tokenization import draw  # noqa: E402
+
+if not hasattr(draw, "draw_dot_contents"):  # the fast package ships no renderer
+    pytest.skip("draw_dot_contents is not available", allow_module_level=True)
+
+COLORS = ["red", "green", "blue"]
+RGB = [(255, 0, 0), (0, 128, 0), (0, 0, 255)]
+
+
+def png(color: str) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (2, 2), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def pixel(image) -> tuple:
+    return image.convert("RGB").getpixel((0, 0))
+
+
+class TestDrawDotContents:
+    def test_splits_one_run_into_images(self, monkeypatch):
+        calls = []
+
+        def pipe(self, format):
+            calls.append(self.source)
+            return b"".join(png(color) for color in COLORS)
+
+        monkeypatch.setattr(draw.Source, "pipe", pipe)
+        images = draw.draw_dot_contents(["a", "b", "c"])
+
+        assert len(calls) == 1
+        assert [pixel(image) for image in images] == RGB
+
+    def test_falls_back_to_one_run_per_graph(self, monkeypatch):
+        calls = []
+
+        def pipe(self, format):
+            calls.append(self.source)
+            # The combined run yields a single image, so the count doesn't match
+            graphs = self.source.count("digraph G")
+            return png(COLORS[len(calls) - 2] if graphs == 1 else "black")
+
+        monkeypatch.setattr(draw.Source, "pipe", pipe)
+        images = draw.draw_dot_contents(["a", "b", "c"])
+
+        assert len(calls) == 1 + len(COLORS)
+        assert [pixel(image) for image in images] == RGB
+
+    def test_empty(self, monkeypatch):
+        monkeypatch.setattr(draw.Source, "pipe", lambda self, format: pytest.fail("dot should not run"))
+        assert draw.draw_dot_contents([]) == []
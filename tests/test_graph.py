@@ -128,7 +128,37 @@ class TestNodeCount:
         assert len(tree_merges) > 0, f"Expected tree merges in {merges}"
 
 
+class TestMerge:
+    def test_merge_single_child_sequence(self):
+        # a sequence that keeps a single child returns that child, merged
+        graph = NodesSequence((utf8("ab"),))
+        assert graph.merge(Node(b'ab'), (Node(b'a'), Node(b'b'))) == Node(b'ab')
+
+    def test_merge_first_node_only_at_end(self):
+        # 'a' occurs only in the last position, where no (a, b) pair can start
+        graph = utf8("ba")
+        assert graph.merge(Node(b'ab'), (Node(b'a'), Node(b'b'))) == graph
+
+    def test_merge_overlapping_occurrences(self):
+        # occurrences are replaced left to right, without overlapping
+        graph = utf8("aaa")
+        assert graph.merge(Node(b'aa'), (Node(b'a'), Node(b'a'))) == NodesSequence((Node(b'aa'), Node(b'a')))
+
+    def test_merge_adjacent_occurrences(self):
+        graph = utf8("abab")
+        assert graph.merge(Node(b'ab'), (Node(b'a'), Node(b'b'))) == NodesSequence((Node(b'ab'), Node(b'ab')))
+
+    def test_merge_longer_than_pair(self):
+        graph = utf8("xabcabc")
+        merged = graph.merge(Node(b'abc'), (Node(b'a'), Node(b'b'), Node(b'c')))
+        assert merged == NodesSequence((Node(b'x'), Node(b'abc'), Node(b'abc')))
+
+
 class TestUnitsWord:
+    # Expected merge keys for 'שלום', encoded once for all assertions
+    LETTERS = tuple(letter.encode() for letter in 'שלום')
+    SUBSEQUENCES = tuple(text.encode() for text in ('של', 'שלו', 'שלום', 'לו', 'לום', 'ום'))
+
     def test_characters_split(self):
         assert characters("שלום") == NodesSequence((
             Node("ש".encode()), Node("ל".encode()), Node("ו".encode()), Node("ם".encode())))
@@ -194,10 +224,8 @@ class TestUnitsWord:
 
         print(merges)
         # Only character sequences should be valid
-        assert merges['ש'.encode()] == 1
-        assert merges['ל'.encode()] == 1
-        assert merges['ו'.encode()] == 1
-        assert merges['ם'.encode()] == 1
+        for key in self.LETTERS:
+            assert merges[key] == 1
 
     def test_utf8_cluster_non_minimal_merges(self):
         GraphSettings.MAX_MERGE_SIZE = 100
@@ -206,16 +234,8 @@ class TestUnitsWord:
         merges = readable_merges(graph)
 
         # Basically, every subsequence is valid
-        assert merges['ש'.encode()] == 1
-        assert merges['ל'.encode()] == 1
-        assert merges['ו'.encode()] == 1
-        assert merges['ם'.encode()] == 1
-        assert merges['של'.encode()] == 1
-        assert merges['שלו'.encode()] == 1
-        assert merges['שלום'.encode()] == 1
-        assert merges['לו'.encode()] == 1
-        assert merges['לום'.encode()] == 1
-        assert merges['ום'.encode()] == 1
+        for key in self.LETTERS + self.SUBSEQUENCES:
+            assert merges[key] == 1
 
 
 class TestWords:
@@ -28,8 +28,9 @@ class TestPretokenizer:
         text = "I'm happy you're here"
         result = pretokenize(text)
         # Contractions should be preserved
-        assert any("I'm" in token for token in result)
-        assert any("you're" in token for token in result)
+        tokens = set(result)
+        assert "I'm" in tokens
+        assert " you're" in tokens
 
     def test_empty_string(self):
         """Test pretokenization of empty string"""
@@ -64,6 +64,27 @@ class TestTokenizerAPI:
         cached = BPETokenizer(cache_maxsize=10).train(texts, num_merges=10)
         assert uncached == cached
 
+    def test_duplicate_texts_and_words_are_built_once(self):
+        # Identical texts and words are built once; counts still weigh every occurrence.
+        from complex_tokenization.graphs.units import utf8_clusters
+
+        built = []
+
+        def units(word):
+            built.append(word)
+            return utf8_clusters(word)
+
+        texts = ["the cat sat", "a dog", "the cat sat"]
+        BoundlessBPETokenizer(units=units).make_trainer(texts)
+        assert sorted(built) == sorted({"the", " cat", " sat", "a", " dog"})
+
+        built.clear()
+        BoundlessBPETokenizer(units=units, cache_maxsize=0).make_trainer(texts)
+        assert len(built) == 8
+
+        uncached = BoundlessBPETokenizer(cache_maxsize=0).train(texts, num_merges=10)
+        assert BoundlessBPETokenizer().train(texts, num_merges=10) == uncached
+
     def test_super_bpe_phase1_matches_bpe(self):
         texts = ["the teacher teaches the thick thing"] * 3
         bpe = BPETokenizer()
@@ -1,12 +1,10 @@
 from complex_tokenization.tokenizer import BNETokenizer
-from tests.utils import text_dataset
 
 
 class TestBNE:
-    def test_large_train_bne_tokenizer(self):
-        texts = list(text_dataset(max_samples=10))
+    def test_large_train_bne_tokenizer(self, small_dataset):
         tok = BNETokenizer(n=4)
-        merges = tok.train(texts, num_merges=10)
+        merges = tok.train(small_dataset, num_merges=10)
 
         expected = [
             (' ', 't', 'h', 'e'),
@@ -1,6 +1,6 @@
 from complex_tokenization.graphs.settings import GraphSettings
 from complex_tokenization.tokenizer import BPETokenizer
-from tests.utils import text_dataset, train_huggingface_tokenizer
+from tests.utils import train_huggingface_tokenizer
 
 
 class TestBPE:
@@ -17,27 +17,24 @@ class TestBPE:
         expected = [(' ', 't'), ('h', 'e')]
         assert merges == expected
 
-    def test_large_train_huggingface_tokenizer(self):
-        texts = list(text_dataset(max_samples=10))
-        merges = train_huggingface_tokenizer(texts, num_merges=10)
+    def test_large_train_huggingface_tokenizer(self, huggingface_merges_10):
+        merges = huggingface_merges_10
         expected = [
             ("Ġ", "t"), ("Ġ", "a"), ("o", "n"), ("h", "e"), ("e", "s"),
             ("e", "r"), ("i", "n"), ("Ġt", "he"), ("e", "d"), ("a", "l"),
         ]
         assert merges == expected
 
-    def test_large_train_complex_tokenizer(self):
-        texts = list(text_dataset(max_samples=10))
-        tok = BPETokenizer()
-        merges = tok.train(texts, num_merges=10)
+    def test_large_train_complex_tokenizer(self, bpe_merges_10):
+        merges = bpe_merges_10
         expected = [
             (" ", "t"), (" ", "a"), ("o", "n"), ("h", "e"), ("e", "s"),
             ("e", "r"), ("i", "n"), (" t", "he"), ("e", "d"), ("a", "l"),
         ]
         assert merges == expected
 
-    def test_memoization_matches_unmemoized(self):
-        texts = list(text_dataset(max_samples=10))
+    def test_memoization_matches_unmemoized(self, small_dataset):
+        texts = small_dataset
         GraphSettings.TRADE_MEMORY_FOR_SPEED = False
         plain = BPETokenizer().train(texts, num_merges=20)
         GraphSettings.TRADE_MEMORY_FOR_SPEED = True
@@ -13,6 +13,12 @@ class TestSuperBPE:
         super_merges = SuperBPETokenizer(disconnected_merges=3).train(texts, num_merges=5)
         assert super_merges[:3] == bpe_merges
 
+    def test_replay_with_first_node_at_word_end(self):
+        # Phase 2 replays (' ', 'at') over ' ta', whose only ' ' comes last
+        texts = ["at at at ta"]
+        merges = SuperBPETokenizer(disconnected_merges=2).train(texts, num_merges=4)
+        assert merges == [('a', 't'), (' ', 'at'), ('at', ' at'), ('at at', ' at')]
+
     def test_super_bpe_differs_from_boundless(self):
         """Super BPE prioritizes intra-word merges; boundless picks by global frequency."""
         texts = ["ab ac ab ac ab ac abcdefghik"]